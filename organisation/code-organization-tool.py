@@ -4,7 +4,7 @@ Godot C# Code Organization Tool
 Automatically organizes C# class files according to a standardized pattern for Godot projects.
 
 SAFETY FEATURES:
-- Creates backups outside project directory to avoid build conflicts
+- Creates backups (a tar archive) outside project directory to avoid build conflicts
 - Preserves Godot [Signal] declarations and [Export] attributes
 - Preserves all existing comments (both inline and standalone)
 - Handles Godot-specific syntax properly
@@ -20,6 +20,9 @@ USAGE:
     python code-organization-tool.py --no-pause               # Organize all files without pausing
     python code-organization-tool.py --batch-size 5           # Custom batch size
     python code-organization-tool.py --regions                # Use #region blocks instead of // comments
+    python code-organization-tool.py --no-cache               # Re-check every file, ignoring cached results and output
+    python code-organization-tool.py --jobs 4                 # Process files on 4 workers (default: all CPUs)
+    python code-organization-tool.py --verbose                # Show matched declarations when validation fails
 
 This tool follows a standardized C# organization pattern:
 1. Fields (including [Export] decorated fields)
@@ -35,76 +38,918 @@ This tool follows a standardized C# organization pattern:
 Supports both organization styles:
 - Traditional // comment sections (default)
 - #region/#endregion blocks (--regions flag)
+
+Skip/organized results are cached per file (keyed by mtime and size) in
+~/.cache/godot_csharp_organizer/cache.json, so unchanged files are not re-read on later runs.
+Files the tool rewrites are cached as written, so they aren't re-read on the next run either.
+Organized output is cached by SHA-256 of the content (plus the tool's own source and the
+section style) under ~/.cache/godot_csharp_organizer/output/, so content organized before
+skips parsing and validation.
 """
 
+import io
 import os
 import re
+import stat
 import sys
-import shutil
+import json
+import time
+import hashlib
+import atexit
+import tarfile
+import threading
+import contextlib
+from itertools import accumulate, repeat
+from operator import sub
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.util import Finalize
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+
+try:
+    import re2  # optional: pip install google-re2
+except ImportError:
+    re2 = None
+
+try:
+    import hyperscan  # optional: pip install hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import liburing  # optional: pip install liburing (Linux 5.19+)
+except ImportError:
+    liburing = None
+
+try:
+    import resource  # Unix only; used to size io_uring waves
+except ImportError:
+    resource = None
+
+# Persistent cache of per-file skip/organized results, shared across projects
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'godot_csharp_organizer', 'cache.json')
+CACHE_VERSION = 1
+# Organized output of previously organized content, one file per SHA-256 key (see output_cache_key)
+OUTPUT_CACHE_DIR = os.path.join(os.path.dirname(CACHE_PATH), 'output')
+OUTPUT_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # cached output older than this (in seconds) is deleted
+OUTPUT_CACHE_PRUNE_INTERVAL = 24 * 60 * 60  # the output cache is checked for old entries at most this often
+
+# Paths containing any of these are never organized
+SKIP_PATH_PATTERNS = (
+    '/.godot/',
+    '/temp/',
+    '/obj/',
+    '/bin/',
+    '/backup',
+    '/Backup',
+    'AssemblyInfo.cs',
+    '.g.cs',  # Generated files
+    '.Designer.cs',  # Visual Studio generated files
+)
+
+# Sections of an organized class body in output order, as (members key, title)
+_SECTIONS = (
+    ('fields', 'Fields'),
+    ('properties', 'Properties'),
+    ('virtual_properties', 'Virtual Properties'),
+    ('constants', 'Constants'),
+    ('enums', 'Enums'),
+    ('signals', 'Signals'),  # Godot-specific
+    ('public_methods', 'Public Methods'),
+    ('protected_methods', 'Protected Methods'),
+    ('private_methods', 'Private Methods'),
+)
+
+# Organization section headers recognised by is_already_organized (both // and #region styles),
+# as (marker, title) pairs matched as ^\s*<marker><title>\s*$
+_SECTION_HEADERS = {
+    # Traditional // comments
+    'fields_comment': (r'//\s*', r'Fields'),
+    'properties_comment': (r'//\s*', r'Properties'),
+    'public_methods_comment': (r'//\s*', r'Public Methods'),
+    'protected_methods_comment': (r'//\s*', r'Protected Methods'),
+    'private_methods_comment': (r'//\s*', r'Private Methods'),
+    'constants_comment': (r'//\s*', r'Constants'),
+    'enums_comment': (r'//\s*', r'Enums'),
+    'signals_comment': (r'//\s*', r'Signals'),
+    # #region comments
+    'fields_region': (r'#region\s+', r'(Fields|Constants|Exported?\s*Fields|Private\s*Fields)'),
+    'properties_region': (r'#region\s+', r'(Properties|Virtual\s*Properties)'),
+    'methods_region': (r'#region\s+', r'(Public\s*Methods?|Private\s*Methods?|Protected\s*Methods?)'),
+    'misc_region': (r'#region\s+', r'(Enums?|Constants?|Signals?)'),
+}
+
+
+def _section_header_alternation() -> str:
+    """Combine all section headers into one alternation, factored on their shared markers."""
+    titles_by_marker = {}
+    for name, (marker, title) in _SECTION_HEADERS.items():
+        titles_by_marker.setdefault(marker, []).append(f'(?P<{name}>{title})')
+    return '|'.join(f"{marker}(?:{'|'.join(titles)})" for marker, titles in titles_by_marker.items())
+
+
+# ASCII whitespace that re's \s matches but RE2's and Hyperscan's \s don't
+_RE_ONLY_WHITESPACE = re.compile(r'[\v\x1c-\x1f]')
+
+
+def _matches_like_re(text: str) -> bool:
+    """Check that RE2 and Hyperscan patterns match the text exactly like the re ones."""
+    return text.isascii() and _RE_ONLY_WHITESPACE.search(text) is None
+
+
+class _LinearTimePattern:
+    """A compiled pattern that also runs on RE2 (linear time, no backtracking) when google-re2 is installed.
+
+    RE2's \\s and \\w only agree with re's on ASCII text without vertical tabs or \\x1c-\\x1f, so anything
+    else (and every pattern RE2 can't compile) stays on the re pattern.
+    """
+
+    _INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'))
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = re.compile(pattern, flags)
+        self.re2_pattern = None
+        if re2 is not None:
+            inline_flags = ''.join(letter for flag, letter in self._INLINE_FLAGS if flags & flag)
+            try:
+                self.re2_pattern = re2.compile(f'(?{inline_flags}){pattern}' if inline_flags else pattern)
+            except re2.error:
+                pass
+
+    def pattern_for(self, text: str):
+        """Pick the RE2 pattern when it is guaranteed to match exactly like the re one."""
+        if self.re2_pattern is not None and _matches_like_re(text):
+            return self.re2_pattern
+        return self.pattern
+
+    def search(self, text: str, *args):
+        return self.pattern_for(text).search(text, *args)
+
+    def finditer(self, text: str, *args):
+        return self.pattern_for(text).finditer(text, *args)
+
+    def findall(self, text: str, *args):
+        return self.pattern_for(text).findall(text, *args)
+
+
+# Regex patterns are compiled once at import time rather than on every call
+_PATTERNS = {
+    **{name: re.compile(rf'^\s*{marker}{title}\s*$', re.MULTILINE | re.IGNORECASE)
+       for name, (marker, title) in _SECTION_HEADERS.items()},
+    # Every section header plus enum/const declarations (case-sensitive) in a single pattern,
+    # so one pass over the content finds them all
+    'organization_scan': re.compile(
+        rf'^\s*(?:(?:{_section_header_alternation()})\s*$'
+        r'|(?-i:(?:public|private|protected|internal)\s+(?:(?P<has_enums>enum)|(?P<has_constants>const))\s))',
+        re.MULTILINE | re.IGNORECASE
+    ),
+    'godot_attribute': re.compile(r'\[(?:(?P<has_exports>Export)|(?P<has_signals>Signal))\]'),
+
+    # Organizable content detection
+    'field_decl': re.compile(r'^\s*(private|protected|public|internal|readonly)\s+[^{(]+[;=][^}]*$', re.MULTILINE),
+    'property_accessor': re.compile(r'{\s*(get|set)'),
+    'method_decl': re.compile(r'^\s*(public|protected|private|internal)\s+[^=;]+\([^)]*\)\s*{', re.MULTILINE),
+
+    # Skip-file detection
+    'public_interface': re.compile(r'public\s+interface\s+\w+'),
+    'public_enum': re.compile(r'public\s+enum\s+\w+'),
+    'public_type': re.compile(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record)\s+\w+'),
+    'static_class': re.compile(r'public\s+static\s+class'),
+    'regular_type': re.compile(r'public\s+(?:(?:partial|abstract|readonly)\s+)*(?:class|struct|record)(?!\s+static)'),
+
+    # Godot signal/export extraction
+    'signal_declaration': _LinearTimePattern(r'\[Signal\]\s*\n?\s*public\s+delegate\s+[^;]+;', re.MULTILINE | re.DOTALL),
+    'export_declaration': _LinearTimePattern(r'\[Export(?:\([^)]*\))?\]\s*\n?\s*(?:public\s+|private\s+|protected\s+)?[^;{]+[;{]', re.MULTILINE | re.DOTALL),
+    'whitespace': re.compile(r'\s+'),
+
+    # Validation
+    'type_declaration': re.compile(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record|interface)\s+\w+'),
+    'method_with_body': _LinearTimePattern(r'(public|private|protected)\s+[^=]*\([^)]*\)\s*{'),
+
+    # Class structure extraction
+    # Modern syntax with primary constructors: class Name(...) { or struct Name(...) {
+    'primary_constructor_type': re.compile(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record)\s+(\w+)\s*\([^)]*\)\s*(?::\s*[^{]+)?\s*{'),
+    # Traditional syntax: class Name { or class Name : Base {
+    'traditional_type': re.compile(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record|interface|enum)\s+(\w+)\s*(?::\s*[^{]+)?\s*{'),
+    'using_statement': re.compile(r'using\s+[^;]+;'),
+    'namespace': re.compile(r'namespace\s+([^;{]+)\s*;?'),
+
+    # Existing organization markers stripped before re-parsing
+    'section_comment_line': re.compile(r'^\s*//\s*(Fields|Properties|Virtual properties|Constants|Enums|Signals|Public Methods|Protected Methods|Private Methods)\s*$', re.MULTILINE),
+    'section_region_line': re.compile(r'^\s*#region\s+(Fields|Properties|Virtual Properties|Constants|Enums|Signals|Public Methods|Protected Methods|Private Methods)\s*$', re.MULTILINE),
+    'endregion_line': re.compile(r'^\s*#endregion\s*$', re.MULTILINE),
+    # All three marker kinds in one pattern, named after the patterns above. It starts at the marker's
+    # first character (outside the groups, so re can skip straight to each '/' or '#') rather than
+    # the line start; callers check that only whitespace precedes it on its line
+    'organization_marker': re.compile(
+        r'(?:/(?P<section_comment_line>/\s*(?:Fields|Properties|Virtual properties|Constants|Enums|Signals|Public Methods|Protected Methods|Private Methods))'
+        r'|#(?:(?P<section_region_line>region\s+(?:Fields|Properties|Virtual Properties|Constants|Enums|Signals|Public Methods|Protected Methods|Private Methods))'
+        r'|(?P<endregion_line>endregion)))(?=[^\S\n]*$)',
+        re.MULTILINE
+    ),
+
+    # Member categorization
+    'const_member': re.compile(r'const\s+\w+'),
+    'enum_member': re.compile(r'enum\s+\w+'),
+    'field_member': re.compile(r'^\s*(private|protected|public|internal)\s+(?:readonly\s+|static\s+)?(?:(?!\s*(override|virtual|abstract)).)*\s+\w+(?:\s*[=;]|\s*$)', re.MULTILINE),
+    'export_field_member': re.compile(r'^\s*\[Export(?:\([^)]*\))?\]\s*', re.MULTILINE),
+    'call_or_accessor': re.compile(r'\(.*\)|{\s*get|{\s*set'),
+    'method_signature': re.compile(r'\(.*\)\s*[{;]'),
+    'public_line': re.compile(r'^\s*public', re.MULTILINE),
+    'protected_line': re.compile(r'^\s*protected', re.MULTILINE),
+    'private_line': re.compile(r'^\s*private', re.MULTILINE),
+}
+
+
+# Everything is_already_organized looks for, as (name, pattern): the section headers plus one
+# probe per content type, named like the groups of organization_scan and godot_attribute
+_ORGANIZATION_PROBES = (
+    *((name, _PATTERNS[name]) for name in _SECTION_HEADERS),
+    ('has_fields', _PATTERNS['field_decl']),
+    ('has_properties', _PATTERNS['property_accessor']),
+    ('has_methods', _PATTERNS['method_decl']),
+    ('has_exports', re.compile(r'\[Export\]')),
+    ('has_signals', re.compile(r'\[Signal\]')),
+    ('has_enums', re.compile(r'^\s*(public|private|protected|internal)\s+enum\s', re.MULTILINE)),
+    ('has_constants', re.compile(r'^\s*(public|private|protected|internal)\s+const\s', re.MULTILINE)),
+)
+
+
+class _HyperscanProbes:
+    """All organization probes compiled into one Hyperscan database, so one scan reports every probe that matches.
+
+    Only ASCII text without vertical tabs or \\x1c-\\x1f is scanned this way, where Hyperscan's byte-oriented
+    classes and case folding agree with re's.
+    """
+
+    def __init__(self):
+        flag_map = ((re.IGNORECASE, hyperscan.HS_FLAG_CASELESS), (re.MULTILINE, hyperscan.HS_FLAG_MULTILINE),
+                    (re.DOTALL, hyperscan.HS_FLAG_DOTALL))
+        self.names = [name for name, _ in _ORGANIZATION_PROBES]
+        self.database = hyperscan.Database()
+        self.database.compile(
+            expressions=[pattern.pattern.encode('ascii') for _, pattern in _ORGANIZATION_PROBES],
+            ids=list(range(len(self.names))),
+            # Each probe only needs to report once
+            flags=[sum(hs_flag for flag, hs_flag in flag_map if pattern.flags & flag) | hyperscan.HS_FLAG_SINGLEMATCH
+                   for _, pattern in _ORGANIZATION_PROBES],
+        )
+        self._local = threading.local()  # scratch space can't be shared between scanning threads
+
+    def scan(self, content: str) -> Optional[set]:
+        """Return the names of the probes found in the content, or None if it can't be scanned exactly."""
+        if not _matches_like_re(content):
+            return None
+
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self.database)
+
+        found = set()
+        self.database.scan(content.encode('ascii'), match_event_handler=self.on_match, context=found, scratch=scratch)
+        return found
+
+    def on_match(self, probe_id: int, start: int, end: int, flags: int, found: set):
+        found.add(self.names[probe_id])
+
+
+_HYPERSCAN_PROBES = _HyperscanProbes() if hyperscan is not None else None
+
+
+def _source_digest() -> Optional[bytes]:
+    """SHA-256 of this tool's own source, so cached output is dropped whenever the organizing code changes."""
+    try:
+        with open(__file__, 'rb') as f:
+            return hashlib.sha256(f.read()).digest()
+    except (OSError, NameError):
+        return None
+
+
+_TOOL_DIGEST = _source_digest()
+
+
+def _count(pattern, text: str) -> int:
+    """Count the matches of a compiled pattern without building a list of them."""
+    return sum(1 for _ in pattern.finditer(text))
+
+
+class _UringBatchIO:
+    """Reads and writes whole files in batches through one io_uring ring, one submission per wave.
+
+    Each file is handled by one linked chain of operations (open into the ring's file table, read
+    or write, close), so a whole wave of files costs a single system call to submit. With sqpoll,
+    a kernel thread polls the ring for new entries, so submitting needs no system call at all
+    while the thread is awake (it sleeps after a second without work).
+
+    Read buffers and the file table are registered with the ring once, so reads don't pin fresh
+    pages and operations don't look up their file descriptors each time. Both are split into two
+    banks for reads, so one wave's reads can be in flight while the previous wave is still in use.
+    """
+
+    WAVE_SIZE = 64  # files per wave by default
+    MAX_WAVE_SIZE = 4096  # a polled ring is kept busy with waves as deep as this (see tuned_wave_size)
+    CHAIN_LENGTH = 3  # operations per file: open, read or write, close
+    SLOTS = 128  # registered read buffers, half for each bank
+    SLOT_SIZE = 32 * 1024  # files that fill their buffer are read again the usual way
+
+    def __init__(self, sqpoll: bool = False, wave_size: int = WAVE_SIZE):
+        self.wave_size = wave_size
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        # Room for a wave of reads still in flight while a wave of writes is submitted
+        liburing.io_uring_queue_init(2 * self.wave_size * self.CHAIN_LENGTH, self.ring,
+                                     liburing.IORING_SETUP_SQPOLL if sqpoll else 0)
+        # Each file in a wave is opened into its own entry of the file table: a wave's worth of entries
+        # for each read bank, then one for writes
+        try:
+            liburing.io_uring_register_files_sparse(self.ring, 3 * self.wave_size)
+        except OSError:
+            self.close()
+            raise
+
+        # Registering buffers can be refused (e.g. over the locked-memory limit); reads then use
+        # buffers of their own
+        self.slots = [bytearray(self.SLOT_SIZE) for _ in range(self.SLOTS)]
+        self._slot_iovecs = liburing.Iovec(self.slots)  # kept alive for as long as it is registered
+        try:
+            liburing.io_uring_register_buffers(self.ring, self._slot_iovecs)
+        except OSError:
+            self.slots = []
+
+        self._bank = 1  # read bank used by the last start_reads
+        self._next_tag = 0
+        self._completed = {}  # tag -> result of operations reaped while waiting for another submission
+
+    def close(self):
+        """Tear down the ring, releasing its registered buffers and file table (and its polling thread)."""
+        if self.ring is not None:
+            liburing.io_uring_queue_exit(self.ring)
+            self.ring = None
+
+    @classmethod
+    def create(cls, sqpoll: bool = False, wave_size: int = WAVE_SIZE) -> Optional['_UringBatchIO']:
+        """Set up a ring, or return None if liburing isn't installed or the kernel can't provide one."""
+        if liburing is None:
+            return None
+        try:
+            return cls(sqpoll, wave_size)
+        except OSError:
+            # Older kernels only allow privileged processes to poll; fall back to an ordinary ring
+            return cls.create() if sqpoll else None
+
+    @classmethod
+    def tuned_wave_size(cls, file_sizes: List[int]) -> int:
+        """Return the deepest wave (up to MAX_WAVE_SIZE) that the open file limit and available memory allow."""
+        wave_size = cls.MAX_WAVE_SIZE
+
+        # The file table (three waves of entries) counts against the open file limit
+        if resource is not None:
+            soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+            if soft_limit != resource.RLIM_INFINITY:
+                wave_size = min(wave_size, soft_limit // 3)
+
+        # Two waves in flight, each file with a read buffer plus its content and organized output,
+        # should take no more than a quarter of the memory available
+        available = _available_memory()
+        if available and file_sizes:
+            per_file = cls.SLOT_SIZE + 2 * sum(file_sizes) // len(file_sizes)
+            wave_size = min(wave_size, available // 4 // (2 * per_file))
+
+        return max(1, wave_size)
+
+    def submit(self, file_paths: List[str], open_flags: int, transfers: List[Tuple], table_base: int) -> range:
+        """Open, read or write, and close up to a wave of files in linked chains, returning the chains' tags.
+
+        transfers holds a (prepare, args) read or write for each file, prepared on its file table entry
+        (from table_base on). Nothing is waited for; pass the tags to complete for the results.
+        """
+        tags = range(self._next_tag, self._next_tag + len(file_paths) * self.CHAIN_LENGTH)
+        self._next_tag = tags.stop
+        ring = self.ring
+        get_sqe, set_flags, set_data = (liburing.io_uring_get_sqe, liburing.io_uring_sqe_set_flags,
+                                        liburing.io_uring_sqe_set_data64)
+        # A short read or write ends an ordinary link, so the close is hard-linked to always run
+        transfer_flags = liburing.IOSQE_FIXED_FILE | liburing.IOSQE_IO_HARDLINK
+        for table_index, file_path, (prepare, args), tag in zip(
+                range(table_base, table_base + len(file_paths)), file_paths, transfers, tags[::self.CHAIN_LENGTH]):
+            sqe = get_sqe(ring)
+            liburing.io_uring_prep_open_direct(sqe, file_path, open_flags, table_index, 0o666)
+            set_flags(sqe, liburing.IOSQE_IO_LINK)  # nothing after a failed open runs
+            set_data(sqe, tag)
+            sqe = get_sqe(ring)
+            prepare(sqe, table_index, *args)
+            set_flags(sqe, transfer_flags)
+            set_data(sqe, tag + 1)
+            sqe = get_sqe(ring)
+            liburing.io_uring_prep_close_direct(sqe, table_index)
+            set_data(sqe, tag + 2)
+        liburing.io_uring_submit(ring)
+        return tags
+
+    def complete(self, tags: range) -> List[Tuple]:
+        """Wait for a submission's chains, returning each file's (open, transfer) results.
+
+        A result is the operation's return value or, if it failed, the matching OSError.
+        """
+        # Some operations may already have been reaped while waiting for another submission
+        results = [self._completed.pop(tag, None) for tag in tags] if self._completed else [None] * len(tags)
+        remaining = results.count(None)
+        ring, cqe = self.ring, self.cqe
+        while remaining:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            tag = entry.user_data
+            try:
+                result = entry.res
+            except OSError as e:  # a negative result is raised as the matching OSError
+                result = e
+            finally:
+                liburing.io_uring_cqe_seen(ring, entry)
+            if tag in tags:
+                results[tag - tags.start] = result
+                remaining -= 1
+            else:
+                self._completed[tag] = result
+
+        return list(zip(results[::self.CHAIN_LENGTH], results[1::self.CHAIN_LENGTH]))
+
+    def start_reads(self, file_paths: List[str], use_slots: bool = True) -> Tuple:
+        """Submit reads of up to a wave of files without waiting for them; finish_reads returns the contents.
+
+        Reads alternate between the two banks, so the contents of one call stay valid until the call
+        after next (or for good, without use_slots).
+        """
+        self._bank ^= 1
+        bank_size = len(self.slots) // 2 if use_slots else 0
+        buffers = []
+        transfers = []
+        for index in range(len(file_paths)):
+            # The size isn't known before the open, so every file gets a whole slot
+            if index < bank_size:
+                slot = self._bank * bank_size + index
+                buffer = self.slots[slot]
+                transfers.append((liburing.io_uring_prep_read_fixed, (buffer, slot, 0)))
+            else:
+                buffer = bytearray(self.SLOT_SIZE)
+                transfers.append((liburing.io_uring_prep_read, (buffer, 0)))
+            buffers.append(buffer)
+        return file_paths, buffers, self.submit(file_paths, os.O_RDONLY, transfers, self._bank * self.wave_size)
+
+    def finish_reads(self, reads: Tuple) -> List:
+        """Wait for reads from start_reads, returning each file's content or the OSError that stopped it.
+
+        Content read into a slot is a memoryview of it.
+        """
+        file_paths, buffers, tags = reads
+        contents = []
+        for file_path, buffer, (open_result, read_result) in zip(file_paths, buffers, self.complete(tags)):
+            error = open_result if isinstance(open_result, OSError) else read_result
+            if isinstance(error, OSError):
+                contents.append(OSError(error.errno, error.strerror, file_path))
+            elif read_result == len(buffer):
+                # The file may be larger than its buffer; read it again the usual way
+                try:
+                    contents.append(_read_file(file_path))
+                except OSError as e:
+                    contents.append(e)
+            else:
+                contents.append(memoryview(buffer)[:read_result])
+        return contents
+
+    def read_files(self, file_paths: List[str]) -> List:
+        """Read each file whole, returning its content or the OSError that stopped it.
+
+        Content read into a slot is a memoryview of it, only valid until the next read_files call.
+        """
+        contents = []
+        for start in range(0, len(file_paths), self.wave_size):
+            # Only the first two waves have a bank to themselves
+            reads = self.start_reads(file_paths[start:start + self.wave_size], use_slots=start < 2 * self.wave_size)
+            contents += self.finish_reads(reads)
+        return contents
+
+    def write_files(self, files: List[Tuple[str, bytes]]) -> List[Optional[OSError]]:
+        """Replace each file's content, returning None for each file written or the OSError that stopped it."""
+        # Writes stay buffered even for large files: O_DIRECT needs aligned buffers (which liburing's
+        # wrapper can't be given) and an fsync to be safe, and together those measured about 20x
+        # slower than a buffered write for a 512 KiB file.
+        # liburing's fixed writes always write a registered buffer whole, so writes use their own data
+        results = []
+        for start in range(0, len(files), self.wave_size):
+            wave = files[start:start + self.wave_size]
+            transfers = [(liburing.io_uring_prep_write, (data, 0)) for _, data in wave]
+            results += self.complete(self.submit([file_path for file_path, _ in wave],
+                                                 os.O_WRONLY | os.O_CREAT | os.O_TRUNC, transfers, 2 * self.wave_size))
+
+        errors = []
+        for (file_path, data), (open_result, write_result) in zip(files, results):
+            error = open_result if isinstance(open_result, OSError) else write_result
+            if isinstance(error, OSError):
+                errors.append(OSError(error.errno, error.strerror, file_path))
+                continue
+            try:
+                # Finish a short write with ordinary writes
+                if write_result < len(data):
+                    fd = os.open(file_path, os.O_WRONLY)
+                    try:
+                        while write_result < len(data):
+                            write_result += os.pwrite(fd, data[write_result:], write_result)
+                    finally:
+                        os.close(fd)
+                errors.append(None)
+            except OSError as e:
+                errors.append(e)
+        return errors
+
+
+def _available_memory() -> Optional[int]:
+    """Return the memory available for new allocations in bytes (MemAvailable), or None where it isn't known."""
+    try:
+        with open('/proc/meminfo', 'rb') as f:
+            for line in f:
+                if line.startswith(b'MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _read_to_end(fd: int, offset: int) -> bytes:
+    """Read whatever is left of a file from an offset."""
+    chunks = []
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+
+def _read_file(file_path: str) -> bytes:
+    """Read a whole file with a single pread sized from fstat (a raw read() where there's no pread)."""
+    if not hasattr(os, 'pread'):
+        # A raw read() sizes its buffer from fstat, so the whole file arrives in one read call
+        with open(file_path, 'rb', buffering=0) as f:
+            return f.read()
+
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        # Asking for one byte more than the size shows whether the file grew since fstat
+        data = os.pread(fd, size + 1, 0)
+        if len(data) > size:
+            data += _read_to_end(fd, len(data))
+        return data
+    except OSError as e:
+        raise OSError(e.errno, e.strerror, file_path) if e.filename is None else e
+    finally:
+        os.close(fd)
+
+
+def _write_file(file_path: str, data: bytes):
+    """Replace a file's content with pwrite calls (a buffered write where there's no pwrite)."""
+    if not hasattr(os, 'pwrite'):
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        return
+
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        written = 0
+        while written < len(view):
+            written += os.pwrite(fd, view[written:], written)
+    finally:
+        os.close(fd)
+
 
 class CSharpClassOrganizer:
-    def __init__(self, project_root: str, use_regions: bool = False):
+    def __init__(self, project_root: str, use_regions: bool = False, cache_path: Optional[str] = CACHE_PATH,
+                 jobs: Optional[int] = None, verbose: bool = False, sqpoll: bool = False,
+                 output_cache_dir: Optional[str] = OUTPUT_CACHE_DIR):
         self.project_root = project_root
+        # Prefix that relative_path can slice off directly; only used when the root is already
+        # absolute and normalized, so slicing gives what relpath would
+        self._root_prefix = (os.path.join(project_root, '')
+                             if os.path.isabs(project_root) and os.path.normpath(project_root) == project_root else None)
         self.use_regions = use_regions
+        self.verbose = verbose
+        self.sqpoll = sqpoll  # poll the io_uring ring from a kernel thread when organizing in this process
+        self.jobs = jobs or os.cpu_count() or 1
+        # Cached results and cached output are only trusted when they can be tied to this exact tool source
+        self.cache_path = cache_path if _TOOL_DIGEST is not None else None
+        self.output_cache_dir = output_cache_dir if _TOOL_DIGEST is not None else None
+        self._file_cache = self.load_file_cache()
+        self._file_cache_dirty = False
+        self._stat_results = {}  # stat results collected while walking the project
+        self._content_results = {}  # (check name, content digest) -> result, for this run
+        # Per thread: the last source read (with its raw bytes) and the last content digested
+        self._digest_state = threading.local()
+        self.output_cache_hits = 0
+        self.output_cache_misses = 0
+        self._batch_io = None  # io_uring batch reads/writes, set up when organizing a project
+        self._prefetched = {}  # file path -> content (or OSError) read ahead for the current batch
+        self._pending_writes = None  # file path -> (data, report, cache results) queued while a batch is organized
+        # Pool workers have no cache of their own; they collect the results for the files they write here
+        self.written_results = None
+        if self.cache_path:
+            atexit.register(self.save_file_cache)
         self.backup_dir = os.path.join(os.path.dirname(project_root), f"godot_csharp_backups_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.backup_archive_name = 'backups.tar'
+        self._backup_archive = None  # opened on the first backup
+        self._backup_lock = threading.Lock()
         self.godot_patterns = {
-            'signals': re.compile(r'\[Signal\]\s+public\s+delegate\s+[^;]+;'),
-            'exports': re.compile(r'\[Export(?:\([^)]*(?:\([^)]*\)[^)]*)*\))?\]\s*\n?\s*(?:public\s+|private\s+|protected\s+)?[^;{]+[;{]', re.MULTILINE | re.DOTALL),
+            'signals': _LinearTimePattern(r'\[Signal\]\s+public\s+delegate\s+[^;]+;'),
+            'exports': _LinearTimePattern(r'\[Export(?:\([^)]*(?:\([^)]*\)[^)]*)*\))?\]\s*\n?\s*(?:public\s+|private\s+|protected\s+)?[^;{]+[;{]', re.MULTILINE | re.DOTALL),
             'signal_emits': re.compile(r'EmitSignal\s*\(\s*SignalName\.[^)]+\)'),
         }
 
-    def create_backup(self, file_path: str) -> str:
-        """Create a backup of the file outside the project directory."""
-        if not os.path.exists(self.backup_dir):
-            os.makedirs(self.backup_dir)
+    def load_file_cache(self) -> Dict[str, Dict]:
+        """Load cached per-file results from disk (empty if caching is disabled or the cache is unreadable)."""
+        if not self.cache_path:
+            return {}
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            # Results from another version of the tool (e.g. after editing its sections or patterns) are dropped
+            if cache.get('version') == CACHE_VERSION and cache.get('tool') == _TOOL_DIGEST.hex():
+                return cache['files']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        return {}
+
+    def save_file_cache(self):
+        """Write cached per-file results back to disk if anything changed."""
+        if not self.cache_path or not self._file_cache_dirty:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'tool': _TOOL_DIGEST.hex(), 'files': self._file_cache}, f)
+            os.replace(temp_path, self.cache_path)
+            self._file_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not write cache {self.cache_path}: {e}")
+
+    def remember_stat(self, file_path: str, stat_result: os.stat_result):
+        """Keep a stat result taken elsewhere for the file's cache lookup, instead of stat-ing it again."""
+        self._stat_results[file_path] = stat_result
+
+    def get_cache_entry(self, file_path: str) -> Dict:
+        """Return the cache entry for a file, starting a fresh one if the file changed since it was cached."""
+        if not self.cache_path:
+            return {}
+
+        stat_result = self._stat_results.get(file_path)
+        if stat_result is None:
+            try:
+                stat_result = os.stat(file_path)
+            except OSError:
+                return {}
+
+        entry = self._file_cache.get(file_path)
+        if not entry or entry.get('mtime_ns') != stat_result.st_mtime_ns or entry.get('size') != stat_result.st_size:
+            entry = {'mtime_ns': stat_result.st_mtime_ns, 'size': stat_result.st_size}
+            self._file_cache[file_path] = entry
+            self._file_cache_dirty = True
+        return entry
+
+    def set_cache_value(self, entry: Dict, key: str, value: bool):
+        """Record a computed result on a cache entry."""
+        # Results that were already cached don't need the cache written out again
+        if 'mtime_ns' in entry and entry.get(key) != value:
+            entry[key] = value
+            self._file_cache_dirty = True
+
+    def written_file_results(self, content: str, encoded: Optional[bytes] = None) -> Optional[Dict[str, bool]]:
+        """Return the cache results for a file about to be rewritten with this content, if anyone keeps them."""
+        if not self.cache_path and self.written_results is None:
+            return None
+        if encoded is not None:
+            self._digest_state.source = (content, encoded)  # hash the bytes being written, without encoding again
+        return {'skip': self.memoized_by_content(self.should_skip_content, content),
+                'organized': self.memoized_by_content(self.is_already_organized, content)}
+
+    def remember_written_file(self, file_path: str, results: Optional[Dict[str, bool]]):
+        """Cache the results for a file just written, so the next run doesn't read it again to check it."""
+        self._stat_results.pop(file_path, None)
+        if results is None:
+            return
+        if not self.cache_path:
+            if self.written_results is not None:
+                self.written_results[file_path] = results
+            return
+
+        # Key the results on the file as written
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return
+        self._file_cache[file_path] = {'mtime_ns': stat_result.st_mtime_ns, 'size': stat_result.st_size, **results}
+        self._file_cache_dirty = True
+
+    def output_cache_key(self, content: str) -> Optional[str]:
+        """Key the organized output of some content by SHA-256 of the tool source, section style and content."""
+        if not self.output_cache_dir:
+            return None
+        style = b'regions' if self.use_regions else b'comments'
+        return hashlib.sha256(_TOOL_DIGEST + style + self.content_digest(content)).hexdigest()
+
+    def output_cache_path(self, key: str) -> str:
+        """Return where the output for a key is cached (spread over subdirectories by its first two digits)."""
+        return os.path.join(self.output_cache_dir, key[:2], key)
+
+    def load_cached_output(self, key: Optional[str]) -> Optional[str]:
+        """Return the cached organized output for a key, or None if there is none."""
+        if key is None:
+            return None
+
+        try:
+            output = str(_read_file(self.output_cache_path(key)), 'utf-8')
+        except (OSError, UnicodeDecodeError):
+            self.output_cache_misses += 1
+            return None
 
-        rel_path = os.path.relpath(file_path, self.project_root)
-        backup_path = os.path.join(self.backup_dir, rel_path)
-        backup_dir = os.path.dirname(backup_path)
+        self.output_cache_hits += 1
+        return output
 
-        if not os.path.exists(backup_dir):
-            os.makedirs(backup_dir)
+    def store_cached_output(self, key: Optional[str], output: str):
+        """Cache the organized output for a key (silently, as the cache is only a shortcut)."""
+        if key is None:
+            return
 
-        shutil.copy2(file_path, backup_path)
-        return backup_path
+        path = self.output_cache_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            _write_file(temp_path, output.encode('utf-8'))
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    def prune_output_cache(self):
+        """Delete cached output older than OUTPUT_CACHE_MAX_AGE, checking at most once per OUTPUT_CACHE_PRUNE_INTERVAL."""
+        if not self.output_cache_dir:
+            return
+
+        # The stamp's modification time records the last check, so most runs only stat it
+        stamp_path = os.path.join(self.output_cache_dir, '.pruned')
+        now = time.time()
+        try:
+            if now - os.stat(stamp_path).st_mtime < OUTPUT_CACHE_PRUNE_INTERVAL:
+                return
+            os.utime(stamp_path)
+        except FileNotFoundError:
+            try:
+                open(stamp_path, 'x').close()
+            except OSError:
+                return
+        except OSError:
+            return
+
+        # Output keyed on an older tool source is never looked up again, so it only ages out here
+        cutoff = now - OUTPUT_CACHE_MAX_AGE
+        try:
+            with os.scandir(self.output_cache_dir) as subdirs:
+                for subdir in subdirs:
+                    if not subdir.is_dir(follow_symlinks=False):
+                        continue
+                    with os.scandir(subdir.path) as entries:
+                        for entry in entries:
+                            if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                                os.remove(entry.path)
+        except OSError:
+            pass
+
+    def report_output_cache(self):
+        """Print how often organized output came from the cache, if it was consulted at all."""
+        if self.output_cache_hits or self.output_cache_misses:
+            print(f"🗃️  Output cache: {self.output_cache_hits} hits, {self.output_cache_misses} misses")
+
+    def relative_path(self, file_path: str) -> str:
+        """Return the file's path relative to the project root, as os.path.relpath would."""
+        # Files found under the root just need the prefix sliced off; relpath normalizes both paths
+        # on every call, so it's only used for anything that might need normalizing
+        if self._root_prefix and file_path.startswith(self._root_prefix):
+            rel_path = file_path[len(self._root_prefix):]
+            if (rel_path and not rel_path.startswith(('.', os.sep)) and os.sep + '.' not in rel_path
+                    and os.sep + os.sep not in rel_path and not rel_path.endswith(os.sep)
+                    and (os.altsep is None or os.altsep not in rel_path)):
+                return rel_path
+        return os.path.relpath(file_path, self.project_root)
+
+    def create_backup(self, file_path: str) -> str:
+        """Add a copy of the file to the backup archive outside the project directory."""
+        rel_path = self.relative_path(file_path)
+
+        content = self._prefetched.get(file_path)
+        with self._backup_lock:
+            archive = self.open_backup_archive()
+            tarinfo = archive.gettarinfo(file_path, arcname=rel_path)
+            if content is not None and not isinstance(content, OSError) and tarinfo.isreg():
+                # The batch already read the file, so archive that copy rather than reading it again
+                tarinfo.size = len(content)
+                archive.addfile(tarinfo, io.BytesIO(content))
+            else:
+                archive.add(file_path, arcname=rel_path)
+            # Every backup must be on disk before its file is rewritten. A batch writes its files back
+            # together, so its members are flushed together just before that (see flush_backup_archive)
+            if self._pending_writes is None:
+                archive.fileobj.flush()
+
+        return f"{archive.name}:{rel_path}"
+
+    def open_backup_archive(self) -> tarfile.TarFile:
+        """Open the backup archive on first use, so runs that change nothing create no backups."""
+        if self._backup_archive is None:
+            os.makedirs(self.backup_dir, exist_ok=True)
+            # Symlinked sources are archived as the content they point to, which is what gets rewritten
+            self._backup_archive = tarfile.open(os.path.join(self.backup_dir, self.backup_archive_name), 'a',
+                                                dereference=True)
+            atexit.register(self.close_backup_archive)
+        return self._backup_archive
+
+    def flush_backup_archive(self):
+        """Write out the backups still buffered in the archive, if one was opened."""
+        with self._backup_lock:
+            if self._backup_archive is not None:
+                self._backup_archive.fileobj.flush()
+
+    def close_backup_archive(self):
+        """Finish the backup archive, if one was opened."""
+        with self._backup_lock:
+            if self._backup_archive is not None:
+                self._backup_archive.close()
+                self._backup_archive = None
+
+    def read_source(self, file_path: str) -> str:
+        """Read a source file in one read (unless its batch read it ahead) and decode it in a single pass."""
+        # Newlines are normalised the same way text mode would
+        raw = self._prefetched.get(file_path)
+        if raw is None:
+            raw = _read_file(file_path)
+        elif isinstance(raw, OSError):
+            raise raw
+        content = str(raw, 'utf-8')
+
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        else:
+            # Valid UTF-8 round-trips exactly, so these bytes are the content's encoding and can be
+            # hashed as they are
+            self._digest_state.source = (content, raw)
+        return content
+
+    def content_digest(self, content: str) -> bytes:
+        """Return the SHA-256 of the content's UTF-8 encoding, computed once per content."""
+        state = self._digest_state
+        last_content, digest = getattr(state, 'digest', (None, None))
+        if content is last_content:
+            return digest
+
+        # Hash the bytes just read (a memoryview of a batch buffer, or bytes) without encoding the
+        # content again; hashlib reads them in place, through OpenSSL's SHA extensions where the CPU has them
+        source_content, raw = getattr(state, 'source', (None, None))
+        digest = hashlib.sha256(raw if content is source_content else content.encode('utf-8')).digest()
+        state.source = (None, None)
+        state.digest = (content, digest)
+        return digest
+
+    def write_source(self, file_path: str, content: str, report: str):
+        """Write organized content back to a file and print the report, or queue both while a batch is organized."""
+        # Newlines are written the way text mode would
+        data = (content if os.linesep == '\n' else content.replace('\n', os.linesep)).encode('utf-8')
+        results = self.written_file_results(content, data if os.linesep == '\n' else None)
+        if self._pending_writes is not None:
+            self._pending_writes[file_path] = (data, report, results)
+            return
+
+        _write_file(file_path, data)
+        self.remember_written_file(file_path, results)
+        print(report, end='')
 
     def is_already_organized(self, content: str) -> bool:
         """Check if file is already organized."""
-        # Look for any organization section comments (both // and #region styles)
-        organization_patterns = [
-            # Traditional // comments
-            r'^\s*//\s*Fields\s*$',
-            r'^\s*//\s*Properties\s*$',
-            r'^\s*//\s*Public Methods\s*$',
-            r'^\s*//\s*Protected Methods\s*$',
-            r'^\s*//\s*Private Methods\s*$',
-            r'^\s*//\s*Constants\s*$',
-            r'^\s*//\s*Enums\s*$',
-            r'^\s*//\s*Signals\s*$',
-            # #region comments
-            r'^\s*#region\s+(Fields|Constants|Exported?\s*Fields|Private\s*Fields)\s*$',
-            r'^\s*#region\s+(Properties|Virtual\s*Properties)\s*$',
-            r'^\s*#region\s+(Public\s*Methods?|Private\s*Methods?|Protected\s*Methods?)\s*$',
-            r'^\s*#region\s+(Enums?|Constants?|Signals?)\s*$'
-        ]
+        # With hyperscan installed one pass finds every section header and content type; otherwise use re
+        found = _HYPERSCAN_PROBES.scan(content) if _HYPERSCAN_PROBES is not None else None
+        if found is None:
+            found = self.find_organization_probes(content)
 
         # Count how many organization sections we find
-        found_sections = 0
-        for pattern in organization_patterns:
-            if re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
-                found_sections += 1
+        found_sections = len(found.intersection(_SECTION_HEADERS))
 
         # Check if the file has any actual organizable content
-        # Fields: private/protected/public fields ending with ; or = (excluding methods and properties)
-        has_fields = bool(re.search(r'^\s*(private|protected|public|internal|readonly)\s+[^{(]+[;=][^}]*$', content, re.MULTILINE))
-        has_properties = bool(re.search(r'{\s*(get|set)', content, re.MULTILINE))
-        has_methods = bool(re.search(r'^\s*(public|protected|private|internal)\s+[^=;]+\([^)]*\)\s*{', content, re.MULTILINE))
-        has_exports = bool(re.search(r'\[Export\]', content))
-        has_signals = bool(re.search(r'\[Signal\]', content))
-        has_enums = bool(re.search(r'^\s*(public|private|protected|internal)\s+enum\s+', content, re.MULTILINE))
-        has_constants = bool(re.search(r'^\s*(public|private|protected|internal)\s+const\s+', content, re.MULTILINE))
+        has_fields = 'has_fields' in found
+        has_properties = 'has_properties' in found
+        has_methods = 'has_methods' in found
+        has_exports = 'has_exports' in found
+        has_signals = 'has_signals' in found
+        has_enums = 'has_enums' in found
+        has_constants = 'has_constants' in found
 
         organizable_content_types = sum([has_fields, has_properties, has_methods, has_exports, has_signals, has_enums, has_constants])
 
@@ -116,52 +961,124 @@ class CSharpClassOrganizer:
         else:
             return found_sections >= 2  # Complex classes need at least 2 sections
 
+    def find_organization_probes(self, content: str) -> set:
+        """Return the names of the _ORGANIZATION_PROBES that match the content, using re."""
+        # Find section headers and enum/const declarations in a single pass over the content.
+        # A header line can satisfy more than one pattern (e.g. '#region Constants'), so the
+        # other section patterns are re-checked at each header found.
+        scan = _PATTERNS['organization_scan']
+        found = set()
+        for match in scan.finditer(content):
+            found.add(match.lastgroup)
+            if match.lastgroup in _SECTION_HEADERS:
+                for name in _SECTION_HEADERS:
+                    if name not in found and _PATTERNS[name].match(content, match.start()):
+                        found.add(name)
+            if len(found) == len(scan.groupindex):
+                break
+
+        # Godot [Export] and [Signal] attributes share a single pass as well
+        for match in _PATTERNS['godot_attribute'].finditer(content):
+            found.add(match.lastgroup)
+            if 'has_exports' in found and 'has_signals' in found:
+                break
+
+        # Fields, properties and methods overlap the declarations above and usually match
+        # near the top of the file, so each keeps its own early-exit search
+        # Fields: private/protected/public fields ending with ; or = (excluding methods and properties)
+        if _PATTERNS['field_decl'].search(content):
+            found.add('has_fields')
+        if _PATTERNS['property_accessor'].search(content):
+            found.add('has_properties')
+        if _PATTERNS['method_decl'].search(content):
+            found.add('has_methods')
+
+        return found
+
+    def is_file_organized(self, file_path: str, content: Optional[str] = None) -> bool:
+        """Check if a file on disk is already organized, reusing the cached result if it is unchanged."""
+        cache_entry = self.get_cache_entry(file_path)
+        if 'organized' in cache_entry:
+            return cache_entry['organized']
+
+        if content is None:
+            content = self.read_source(file_path)
+
+        organized = self.memoized_by_content(self.is_already_organized, content)
+        self.set_cache_value(cache_entry, 'organized', organized)
+        return organized
+
+    def memoized_by_content(self, check, content: str) -> bool:
+        """Run a check that depends only on file content once per distinct content in this run."""
+        # The content's digest keys the result without keeping every file's content alive
+        key = (check.__name__, self.content_digest(content))
+        result = self._content_results.get(key)
+        if result is None:
+            result = self._content_results[key] = check(content)
+        return result
+
+    def needs_reading(self, file_path: str, organizing: bool = True) -> bool:
+        """Check whether organizing (or just checking) the file will read it, i.e. no cached result settles it first."""
+        if self.is_path_excluded(file_path):
+            return False
+        cache_entry = self.get_cache_entry(file_path)
+        if 'skip' not in cache_entry:
+            return True
+        # Checking only needs to know whether it's organized; organizing reads it unless it is
+        return not cache_entry['skip'] and ('organized' not in cache_entry if not organizing
+                                            else not cache_entry.get('organized'))
+
+    def is_path_excluded(self, file_path: str) -> bool:
+        """Check the path against the skip patterns, without touching the file."""
+        normalized_path = file_path.replace('\\', '/')
+        return any(pattern in normalized_path for pattern in SKIP_PATH_PATTERNS)
+
     def should_skip_file(self, file_path: str) -> bool:
         """Determine if file should be skipped."""
-        skip_patterns = [
-            '/.godot/',
-            '/temp/',
-            '/obj/',
-            '/bin/',
-            '/backup',
-            '/Backup',
-            'AssemblyInfo.cs',
-            '.g.cs',  # Generated files
-            '.Designer.cs',  # Visual Studio generated files
-        ]
+        return self.classify_file(file_path)[0]
 
+    def classify_file(self, file_path: str) -> Tuple[bool, Optional[str]]:
+        """Determine if file should be skipped, returning the content if it had to be read so callers can reuse it."""
         # Skip if it's in any of the skip patterns
-        normalized_path = file_path.replace('\\', '/')
-        if any(pattern in normalized_path for pattern in skip_patterns):
-            return True
+        if self.is_path_excluded(file_path):
+            return True, None
+
+        # Reuse the content check from a previous run if the file is unchanged
+        cache_entry = self.get_cache_entry(file_path)
+        if 'skip' in cache_entry:
+            return cache_entry['skip'], None
 
-        # Skip if it's primarily static classes/constants (like settings.cs)
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self.read_source(file_path)
+        except Exception:
+            # Unreadable files aren't skipped; organizing them reports the error
+            content = None
 
-            # Skip files with only interfaces
-            if re.search(r'public\s+interface\s+\w+', content) and not re.search(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record)\s+\w+', content):
-                return True
+        skip = content is not None and self.memoized_by_content(self.should_skip_content, content)
+        self.set_cache_value(cache_entry, 'skip', skip)
+        return skip, content
 
-            # Skip files with only enums (no classes/structs to organize)
-            if re.search(r'public\s+enum\s+\w+', content) and not re.search(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record)\s+\w+', content):
-                return True
+    def should_skip_content(self, content: str) -> bool:
+        """Determine if file should be skipped based on its content (e.g. static-only classes like settings.cs)."""
+        # Skip files with only interfaces
+        if _PATTERNS['public_interface'].search(content) and not _PATTERNS['public_type'].search(content):
+            return True
 
-            # Count static classes vs regular types (classes, structs, records)
-            static_classes = len(re.findall(r'public\s+static\s+class', content))
-            regular_types = len(re.findall(r'public\s+(?:(?:partial|abstract|readonly)\s+)*(?:class|struct|record)(?!\s+static)', content))
+        # Skip files with only enums (no classes/structs to organize)
+        if _PATTERNS['public_enum'].search(content) and not _PATTERNS['public_type'].search(content):
+            return True
 
-            # Skip if it's mostly static classes or has no types at all
-            if static_classes > 0 and regular_types == 0:
-                return True
+        # Count static classes vs regular types (classes, structs, records)
+        static_classes = _count(_PATTERNS['static_class'], content)
+        regular_types = _count(_PATTERNS['regular_type'], content)
 
-            # Skip if file is very small or mostly empty
-            if len(content.strip()) < 100:
-                return True
+        # Skip if it's mostly static classes or has no types at all
+        if static_classes > 0 and regular_types == 0:
+            return True
 
-        except Exception:
-            pass
+        # Skip if file is very small or mostly empty
+        if len(content.strip()) < 100:
+            return True
 
         return False
 
@@ -170,15 +1087,10 @@ class CSharpClassOrganizer:
         signals = []
 
         # Match complete signal declarations including multi-line ones
-        signal_pattern = re.compile(
-            r'\[Signal\]\s*\n?\s*public\s+delegate\s+[^;]+;',
-            re.MULTILINE | re.DOTALL
-        )
-
-        for match in signal_pattern.finditer(content):
+        for match in _PATTERNS['signal_declaration'].finditer(content):
             signal_text = match.group(0).strip()
             # Normalize whitespace but preserve structure
-            signal_text = re.sub(r'\s+', ' ', signal_text)
+            signal_text = _PATTERNS['whitespace'].sub(' ', signal_text)
             signal_text = signal_text.replace('[Signal] ', '[Signal]\n    ')
             signals.append(signal_text)
 
@@ -189,12 +1101,7 @@ class CSharpClassOrganizer:
         exports = []
 
         # Match [Export] attributes with their associated fields/properties
-        export_pattern = re.compile(
-            r'\[Export(?:\([^)]*\))?\]\s*\n?\s*(?:public\s+|private\s+|protected\s+)?[^;{]+[;{]',
-            re.MULTILINE | re.DOTALL
-        )
-
-        for match in export_pattern.finditer(content):
+        for match in _PATTERNS['export_declaration'].finditer(content):
             export_text = match.group(0).strip()
             exports.append(export_text)
 
@@ -203,92 +1110,112 @@ class CSharpClassOrganizer:
     def organize_file(self, file_path: str) -> bool:
         """Organize a single C# file according to the standard pattern."""
         try:
+            rel_path = self.relative_path(file_path)
+
             # Skip files that shouldn't be organized
-            if self.should_skip_file(file_path):
-                print(f"⏭️  Skipped: {os.path.relpath(file_path, self.project_root)} (auto-excluded)")
+            skip, content = self.classify_file(file_path)
+            if skip:
+                print(f"⏭️  Skipped: {rel_path} (auto-excluded)")
                 return True
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                original_content = f.read()
+            # Unchanged files already known to be organized don't need to be read again
+            cache_entry = self.get_cache_entry(file_path)
+            if cache_entry.get('organized'):
+                print(f"✅ Already organized: {rel_path}")
+                return True
+
+            # Reuse the content read while classifying the file, if any
+            original_content = content if content is not None else self.read_source(file_path)
 
             # Check if already organized
-            if self.is_already_organized(original_content):
-                print(f"✅ Already organized: {os.path.relpath(file_path, self.project_root)}")
+            if self.memoized_by_content(self.is_already_organized, original_content):
+                self.set_cache_value(cache_entry, 'organized', True)
+                print(f"✅ Already organized: {rel_path}")
                 return True
 
             # Create backup
             backup_path = self.create_backup(file_path)
 
-            # Extract Godot signals before reorganization (extracted separately to preserve exact formatting)
-            godot_signals = self.extract_godot_signals(original_content)
-
-            # Note: [Export] attributes are handled during normal member parsing to avoid duplicates
-
-            # Extract class information
-            class_info = self.extract_class_structure(original_content)
-            if not class_info:
-                print(f"⚠️  Could not parse class structure in {os.path.relpath(file_path, self.project_root)}")
-                return False
-
-            # Reorganize the content
-            organized_content = self.reorganize_class_content(class_info, original_content, godot_signals)
-
-            # Validate the organized content
-            if not self.validate_organized_content(original_content, organized_content):
-                print(f"❌ Validation failed for {os.path.relpath(file_path, self.project_root)}")
-                return False
+            # Content organized before (by this same tool and style) doesn't need parsing and validating again
+            output_key = self.output_cache_key(original_content)
+            organized_content = self.load_cached_output(output_key)
+            if organized_content is None:
+                organized_content = self.organize_content(original_content, rel_path)
+                if organized_content is None:
+                    return False
+                self.store_cached_output(output_key, organized_content)
 
             # Write back to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(organized_content)
-
-            print(f"✅ Organized: {os.path.relpath(file_path, self.project_root)}")
-            print(f"   📁 Backup: {backup_path}")
+            self.write_source(file_path, organized_content, f"✅ Organized: {rel_path}\n   📁 Backup: {backup_path}\n")
             return True
 
         except Exception as e:
             print(f"❌ Error organizing {file_path}: {str(e)}")
             return False
 
+    def organize_content(self, original_content: str, rel_path: str) -> Optional[str]:
+        """Return the organized content, or None (after reporting why) if it can't be organized safely."""
+        # Extract Godot signals before reorganization (extracted separately to preserve exact formatting)
+        godot_signals = self.extract_godot_signals(original_content)
+
+        # Note: [Export] attributes are handled during normal member parsing to avoid duplicates
+
+        # Extract class information
+        class_info = self.extract_class_structure(original_content)
+        if not class_info:
+            print(f"⚠️  Could not parse class structure in {rel_path}")
+            return None
+
+        # Reorganize the content
+        organized_content = self.reorganize_class_content(class_info, original_content, godot_signals)
+
+        # Validate the organized content
+        if not self.validate_organized_content(original_content, organized_content):
+            print(f"❌ Validation failed for {rel_path}")
+            return None
+
+        return organized_content
+
     def validate_organized_content(self, original: str, organized: str) -> bool:
         """Validate that important content wasn't lost during reorganization."""
         # Check that signal count is preserved
-        original_signals = len(self.godot_patterns['signals'].findall(original))
-        organized_signals = len(self.godot_patterns['signals'].findall(organized))
+        original_signals = _count(self.godot_patterns['signals'], original)
+        organized_signals = _count(self.godot_patterns['signals'], organized)
 
         if original_signals != organized_signals:
             print(f"❌ Signal count mismatch: {original_signals} -> {organized_signals}")
             return False
 
         # Check that export count is preserved
-        original_exports = len(self.godot_patterns['exports'].findall(original))
-        organized_exports = len(self.godot_patterns['exports'].findall(organized))
+        original_exports = _count(self.godot_patterns['exports'], original)
+        organized_exports = _count(self.godot_patterns['exports'], organized)
 
         if original_exports != organized_exports:
             print(f"❌ Export count mismatch: {original_exports} -> {organized_exports}")
-            print(f"Original exports found: {self.godot_patterns['exports'].findall(original)}")
-            print(f"Organized exports found: {self.godot_patterns['exports'].findall(organized)}")
+            if self.verbose:
+                print(f"Original exports found: {self.godot_patterns['exports'].findall(original)}")
+                print(f"Organized exports found: {self.godot_patterns['exports'].findall(organized)}")
             return False
 
         # Check that basic class structure is preserved
-        original_class_count = len(re.findall(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record|interface)\s+\w+', original))
-        organized_class_count = len(re.findall(r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record|interface)\s+\w+', organized))
+        original_class_count = _count(_PATTERNS['type_declaration'], original)
+        organized_class_count = _count(_PATTERNS['type_declaration'], organized)
 
         if original_class_count != organized_class_count:
             print(f"❌ Class count mismatch: {original_class_count} -> {organized_class_count}")
             return False
 
         # Check for basic content preservation (method count, property count)
-        original_methods = len(re.findall(r'(public|private|protected)\s+[^=]*\([^)]*\)\s*{', original))
-        organized_methods = len(re.findall(r'(public|private|protected)\s+[^=]*\([^)]*\)\s*{', organized))
+        original_methods = _count(_PATTERNS['method_with_body'], original)
+        organized_methods = _count(_PATTERNS['method_with_body'], organized)
 
         if abs(original_methods - organized_methods) > 1:  # Allow small variance for parsing differences
             print(f"❌ Method count difference too large: {original_methods} -> {organized_methods}")
             return False
 
         # Check that comments are preserved (approximate check)
-        original_comment_lines = len([line for line in original.split('\n') if line.strip().startswith('//')])
-        organized_comment_lines = len([line for line in organized.split('\n') if line.strip().startswith('//')])
+        original_comment_lines = self.count_comment_lines(original)
+        organized_comment_lines = self.count_comment_lines(organized)
         
         # Allow for some variance due to organization comments being added/removed
         if organized_comment_lines < original_comment_lines - 5:  # Allow for some organization comments being removed
@@ -297,6 +1224,21 @@ class CSharpClassOrganizer:
 
         return True
 
+    def count_comment_lines(self, content: str) -> int:
+        """Count lines starting with // (after whitespace), jumping between '//' occurrences with str.find."""
+        count = 0
+        pos = content.find('//')
+        while pos != -1:
+            # Only the first '//' on a line can start it, so check what precedes it and move to the next line
+            line_start = content.rfind('\n', 0, pos) + 1
+            if not content[line_start:pos].strip():
+                count += 1
+            line_end = content.find('\n', pos)
+            if line_end == -1:
+                break
+            pos = content.find('//', line_end)
+        return count
+
     def extract_class_structure(self, content: str) -> Optional[Dict]:
         """Extract the structure of a C# class, struct, record, interface, or enum."""
         # Enhanced pattern to handle modern C# syntax including:
@@ -304,15 +1246,13 @@ class CSharpClassOrganizer:
         # - classes with primary constructors
         # - records with primary constructors
         type_patterns = [
-            # Modern syntax with primary constructors: class Name(...) { or struct Name(...) {
-            r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record)\s+(\w+)\s*\([^)]*\)\s*(?::\s*[^{]+)?\s*{',
-            # Traditional syntax: class Name { or class Name : Base {
-            r'public\s+(?:(?:partial|abstract|static|readonly)\s+)*(?:class|struct|record|interface|enum)\s+(\w+)\s*(?::\s*[^{]+)?\s*{',
+            _PATTERNS['primary_constructor_type'],
+            _PATTERNS['traditional_type'],
         ]
 
         type_match = None
         for pattern in type_patterns:
-            type_match = re.search(pattern, content)
+            type_match = pattern.search(content)
             if type_match:
                 break
 
@@ -322,9 +1262,10 @@ class CSharpClassOrganizer:
         type_name = type_match.group(1)
         type_start = type_match.end() - 1  # Position of opening brace
 
-        # Extract using statements and namespace
-        using_statements = re.findall(r'using\s+[^;]+;', content[:type_start])
-        namespace_match = re.search(r'namespace\s+([^;{]+)\s*;?', content[:type_start])
+        # Extract using statements and namespace (endpos bounds the search to the text before the type
+        # exactly as slicing would, without copying it)
+        using_statements = _PATTERNS['using_statement'].findall(content, 0, type_start)
+        namespace_match = _PATTERNS['namespace'].search(content, 0, type_start)
         namespace = namespace_match.group(1).strip() if namespace_match else ""
 
         return {
@@ -344,15 +1285,24 @@ class CSharpClassOrganizer:
         class_start = class_info['class_start']
         pre_class = original_content[:class_start + 1]
 
-        # Find the class end
+        # Find the class end, jumping between braces with str.find rather than stepping through each character
         brace_count = 1
         pos = class_start + 1
-        while pos < len(original_content) and brace_count > 0:
-            if original_content[pos] == '{':
+        next_open = original_content.find('{', pos)
+        next_close = original_content.find('}', pos)
+        while brace_count > 0 and next_close != -1:
+            if next_open != -1 and next_open < next_close:
                 brace_count += 1
-            elif original_content[pos] == '}':
+                pos = next_open + 1
+                next_open = original_content.find('{', pos)
+            else:
                 brace_count -= 1
-            pos += 1
+                pos = next_close + 1
+                next_close = original_content.find('}', pos)
+
+        # An unterminated class runs to the end of the file
+        if brace_count > 0:
+            pos = len(original_content)
 
         class_body = original_content[class_start + 1:pos - 1]
         post_class = original_content[pos - 1:]
@@ -389,10 +1339,19 @@ class CSharpClassOrganizer:
         }
 
         # Only remove existing organization comments to avoid duplication (both // and #region styles)
-        # But preserve all other comments
-        clean_body = re.sub(r'^\s*//\s*(Fields|Properties|Virtual properties|Constants|Enums|Signals|Public Methods|Protected Methods|Private Methods)\s*$', '', class_body, flags=re.MULTILINE)
-        clean_body = re.sub(r'^\s*#region\s+(Fields|Properties|Virtual Properties|Constants|Enums|Signals|Public Methods|Protected Methods|Private Methods)\s*$', '', clean_body, flags=re.MULTILINE)
-        clean_body = re.sub(r'^\s*#endregion\s*$', '', clean_body, flags=re.MULTILINE)
+        # But preserve all other comments.
+        # One pass finds which kinds of marker are present (usually none in files still needing
+        # organization), and only those removals run, in their original order so blank-line
+        # handling around adjacent markers is unchanged.
+        marker_kinds = set()
+        for match in _PATTERNS['organization_marker'].finditer(class_body):
+            line_start = class_body.rfind('\n', 0, match.start()) + 1
+            if not class_body[line_start:match.start()].strip():
+                marker_kinds.add(match.lastgroup)
+        clean_body = class_body
+        for kind in ('section_comment_line', 'section_region_line', 'endregion_line'):
+            if kind in marker_kinds:
+                clean_body = _PATTERNS[kind].sub('', clean_body)
 
         # Split into logical blocks
         blocks = self.split_into_blocks(clean_body)
@@ -414,21 +1373,13 @@ class CSharpClassOrganizer:
 
     def is_standalone_comment(self, block: str) -> bool:
         """Check if a block is a standalone comment (not attached to code)."""
-        lines = block.strip().split('\n')
-        
         # Check if all non-empty lines are comments
-        for line in lines:
+        for line in block.split('\n'):
             stripped = line.strip()
-            if not stripped:
-                continue
-            # Check for single-line comments, multi-line comments, or XML documentation
-            if not (stripped.startswith('//') or 
-                   stripped.startswith('/*') or 
-                   stripped.endswith('*/') or 
-                   stripped.startswith('*') or
-                   stripped.startswith('///')):
+            # Check for single-line comments (including XML documentation) or multi-line comments
+            if stripped and not (stripped.startswith(('//', '/*', '*')) or stripped.endswith('*/')):
                 return False
-        
+
         return True
 
     def split_into_blocks(self, content: str) -> List[str]:
@@ -436,42 +1387,38 @@ class CSharpClassOrganizer:
         blocks = []
         lines = content.split('\n')
         current_block = []
-        brace_depth = 0
         in_member = False
         pending_comments = []
 
-        for line in lines:
-            stripped = line.strip()
+        # Brace depth after each line, used to track method/property boundaries
+        # (computed up front with C-level map/accumulate rather than per line in Python)
+        brace_depths = accumulate(map(sub, map(str.count, lines, repeat('{')), map(str.count, lines, repeat('}'))))
 
-            # Count braces to track method/property boundaries
-            brace_depth += line.count('{') - line.count('}')
+        for line, brace_depth in zip(lines, brace_depths):
+            # Inside a member, lines only need checking once we're back at brace depth 0
+            if in_member:
+                current_block.append(line)
+                if brace_depth == 0 and line.rstrip().endswith((';', '}')):
+                    blocks.append('\n'.join(current_block))
+                    current_block = []
+                    in_member = False
+                continue
 
-            # Check if this line is a comment
-            is_comment_line = (stripped.startswith('//') or 
-                             stripped.startswith('/*') or 
-                             stripped.startswith('*') or 
-                             stripped.startswith('///') or
-                             stripped.endswith('*/') or
-                             not stripped)  # Include empty lines
+            stripped = line.strip()
 
-            # If we're not in a member and encounter a comment, collect it
-            if not in_member and is_comment_line:
+            # If we're not in a member and encounter a comment (or empty line), collect it
+            if not stripped or stripped.startswith(('//', '/*', '*')) or stripped.endswith('*/'):
                 pending_comments.append(line)
                 continue
 
             # Start of a new member (field, property, method, etc.)
-            if (re.match(r'^(private|protected|public|internal|\[)', stripped) and
-                brace_depth == 0 and not in_member):
-
+            if brace_depth == 0 and stripped.startswith(('private', 'protected', 'public', 'internal', '[')):
                 if current_block:
                     blocks.append('\n'.join(current_block))
-                    current_block = []
 
                 # Add any pending comments to this member block
-                if pending_comments:
-                    current_block.extend(pending_comments)
-                    pending_comments = []
-
+                current_block = pending_comments
+                pending_comments = []
                 in_member = True
 
             current_block.append(line)
@@ -485,7 +1432,7 @@ class CSharpClassOrganizer:
         # Add any remaining content
         if current_block:
             blocks.append('\n'.join(current_block))
-        
+
         # Add any remaining standalone comments as a separate block
         if pending_comments:
             blocks.append('\n'.join(pending_comments))
@@ -501,200 +1448,157 @@ class CSharpClassOrganizer:
             return 'signals'
 
         # Constants
-        if re.search(r'const\s+\w+', stripped):
+        if _PATTERNS['const_member'].search(stripped):
             return 'constants'
 
         # Enums
-        if re.search(r'enum\s+\w+', stripped):
+        if _PATTERNS['enum_member'].search(stripped):
             return 'enums'
 
-        # Fields (including [Export] fields)
-        field_patterns = [
-            # Regular fields
-            r'^\s*(private|protected|public|internal)\s+(?:readonly\s+|static\s+)?(?:(?!\s*(override|virtual|abstract)).)*\s+\w+(?:\s*[=;]|\s*$)',
-            # [Export] decorated fields (with optional parameters)
-            r'^\s*\[Export(?:\([^)]*\))?\]\s*',
-        ]
-
-        for pattern in field_patterns:
-            if re.search(pattern, stripped, re.MULTILINE):
-                # Exclude methods and properties
-                if not re.search(r'\(.*\)|{\s*get|{\s*set', stripped):
-                    return 'fields'
+        # A call or accessor rules out a field, and without one a block can't be a property or method,
+        # so this one check decides which of the patterns below can still match
+        if not _PATTERNS['call_or_accessor'].search(stripped):
+            # Fields (including [Export] decorated fields, with optional parameters)
+            if _PATTERNS['export_field_member'].search(stripped) or _PATTERNS['field_member'].search(stripped):
+                return 'fields'
+            return None
 
         # Properties
-        if re.search(r'{\s*(get|set)', stripped):
+        if _PATTERNS['property_accessor'].search(stripped):
             if 'virtual' in stripped or 'override' in stripped:
                 return 'virtual_properties'
             else:
                 return 'properties'
 
-        # Methods
-        if re.search(r'\(.*\)\s*{', stripped) or re.search(r'\(.*\)\s*;', stripped):
-            if re.search(r'^\s*public', stripped, re.MULTILINE):
+        # Methods (a parameter list followed by a body or a ';')
+        if _PATTERNS['method_signature'].search(stripped):
+            if _PATTERNS['public_line'].search(stripped):
                 return 'public_methods'
-            elif re.search(r'^\s*protected', stripped, re.MULTILINE):
+            elif _PATTERNS['protected_line'].search(stripped):
                 return 'protected_methods'
-            elif re.search(r'^\s*private', stripped, re.MULTILINE):
+            elif _PATTERNS['private_line'].search(stripped):
                 return 'private_methods'
 
         return None
 
     def build_organized_class_body(self, members: Dict[str, List[str]]) -> str:
-        """Build the organized class body with proper sections."""
-        if self.use_regions:
-            return self.build_organized_class_body_with_regions(members)
-        else:
-            return self.build_organized_class_body_with_comments(members)
-
-    def build_organized_class_body_with_regions(self, members: Dict[str, List[str]]) -> str:
-        """Build the organized class body with #region sections."""
+        """Build the organized class body with #region or // comment sections, in the standard order."""
         sections = []
 
         # Add preserved comments at the top
         if members['comments']:
-            sections.extend([f'    {comment}' for comment in members['comments']])
-            sections.append('')
-
-        # Fields section
-        if members['fields']:
-            sections.append('    #region Fields')
-            sections.extend([f'    {member}' for member in members['fields']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Properties section
-        if members['properties']:
-            sections.append('    #region Properties')
-            sections.extend([f'    {member}' for member in members['properties']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Virtual properties section
-        if members['virtual_properties']:
-            sections.append('    #region Virtual Properties')
-            sections.extend([f'    {member}' for member in members['virtual_properties']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Constants section
-        if members['constants']:
-            sections.append('    #region Constants')
-            sections.extend([f'    {member}' for member in members['constants']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Enums section
-        if members['enums']:
-            sections.append('    #region Enums')
-            sections.extend([f'    {member}' for member in members['enums']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Signals section (Godot-specific)
-        if members['signals']:
-            sections.append('    #region Signals')
-            sections.extend([f'    {member}' for member in members['signals']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Public methods section
-        if members['public_methods']:
-            sections.append('    #region Public Methods')
-            sections.extend([f'    {member}' for member in members['public_methods']])
-            sections.append('    #endregion')
-            sections.append('')
-
-        # Protected methods section
-        if members['protected_methods']:
-            sections.append('    #region Protected Methods')
-            sections.extend([f'    {member}' for member in members['protected_methods']])
-            sections.append('    #endregion')
+            sections.extend(['    ' + comment for comment in members['comments']])
             sections.append('')
 
-        # Private methods section
-        if members['private_methods']:
-            sections.append('    #region Private Methods')
-            sections.extend([f'    {member}' for member in members['private_methods']])
-            sections.append('    #endregion')
+        header, footer = ('    #region ', '    #endregion') if self.use_regions else ('    // ', None)
+        last_key = _SECTIONS[-1][0]
+        for key, title in _SECTIONS:
+            self.emit_section(sections, header + title, members[key], footer, blank_line=key != last_key)
 
         return '\n' + '\n'.join(sections) + '\n'
 
-    def build_organized_class_body_with_comments(self, members: Dict[str, List[str]]) -> str:
-        """Build the organized class body with // comment sections."""
-        sections = []
-
-        # Add preserved comments at the top
-        if members['comments']:
-            sections.extend([f'    {comment}' for comment in members['comments']])
-            sections.append('')
-
-        # Fields section
-        if members['fields']:
-            sections.append('    // Fields')
-            sections.extend([f'    {member}' for member in members['fields']])
-            sections.append('')
-
-        # Properties section
-        if members['properties']:
-            sections.append('    // Properties')
-            sections.extend([f'    {member}' for member in members['properties']])
-            sections.append('')
-
-        # Virtual properties section
-        if members['virtual_properties']:
-            sections.append('    // Virtual Properties')
-            sections.extend([f'    {member}' for member in members['virtual_properties']])
-            sections.append('')
-
-        # Constants section
-        if members['constants']:
-            sections.append('    // Constants')
-            sections.extend([f'    {member}' for member in members['constants']])
-            sections.append('')
-
-        # Enums section
-        if members['enums']:
-            sections.append('    // Enums')
-            sections.extend([f'    {member}' for member in members['enums']])
-            sections.append('')
-
-        # Signals section (Godot-specific)
-        if members['signals']:
-            sections.append('    // Signals')
-            sections.extend([f'    {member}' for member in members['signals']])
-            sections.append('')
-
-        # Public methods section
-        if members['public_methods']:
-            sections.append('    // Public Methods')
-            sections.extend([f'    {member}' for member in members['public_methods']])
-            sections.append('')
-
-        # Protected methods section
-        if members['protected_methods']:
-            sections.append('    // Protected Methods')
-            sections.extend([f'    {member}' for member in members['protected_methods']])
-            sections.append('')
-
-        # Private methods section
-        if members['private_methods']:
-            sections.append('    // Private Methods')
-            sections.extend([f'    {member}' for member in members['private_methods']])
+    def emit_section(self, lines: List[str], header: str, section_members: List[str], footer: Optional[str] = None,
+                     blank_line: bool = True):
+        """Append a non-empty section's header, indented members and optional footer to the output lines."""
+        if not section_members:
+            return
 
-        return '\n' + '\n'.join(sections) + '\n'
+        lines.append(header)
+        lines.extend(['    ' + member for member in section_members])
+        if footer is not None:
+            lines.append(footer)
+        if blank_line:
+            lines.append('')
 
     def find_cs_files(self) -> List[str]:
         """Find all C# files in the project."""
+        cs_files = list(self.iter_cs_files(self.project_root))
+        self.prune_file_cache(cs_files)
+        return cs_files
+
+    def prune_file_cache(self, cs_files: List[str]):
+        """Drop the cache entries for files under the project root that the walk no longer finds."""
+        # The cache is shared across projects, so entries outside this project are left alone
+        prefix = os.path.join(self.project_root, '')
+        found = set(cs_files)
+        stale = [file_path for file_path in self._file_cache if file_path.startswith(prefix) and file_path not in found]
+        for file_path in stale:
+            del self._file_cache[file_path]
+        if stale:
+            self._file_cache_dirty = True
+
+    def iter_cs_files(self, directory: str) -> Iterator[str]:
+        """Yield all C# files under a directory, files before subdirectories (like os.walk)."""
         cs_files = []
-        for root, dirs, files in os.walk(self.project_root):
-            # Skip backup directories and .godot
-            dirs[:] = [d for d in dirs if not d.startswith('.') and 'backup' not in d.lower()]
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        # Skip backup directories and .godot (and don't follow directory symlinks)
+                        if not entry.name.startswith('.') and 'backup' not in entry.name.lower() and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.cs'):
+                        cs_files.append(entry.path)
+                        # Keep the stat result for cache lookups instead of stat-ing the file again later;
+                        # excluded files (build output, generated code) never reach the cache
+                        if self.cache_path and not self.is_path_excluded(entry.path):
+                            try:
+                                self._stat_results[entry.path] = entry.stat()
+                            except OSError:
+                                pass
+        except OSError:
+            return
+
+        yield from cs_files
+        for subdir in subdirs:
+            yield from self.iter_cs_files(subdir)
+
+    def map_threaded(self, func, items: List[str]) -> Iterator:
+        """Apply func to each item on a thread pool (for read-dominated work), yielding results in order."""
+        if self.jobs <= 1 or len(items) < 2:
+            yield from map(func, items)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.jobs * 4) as executor:
+            yield from executor.map(func, items)
+
+    def check_file(self, file_path: str):
+        """Return (skipped, organized, error) for a file without printing anything."""
+        skip, content = self.classify_file(file_path)
+        if skip:
+            return True, False, None
 
-            for file in files:
-                if file.endswith('.cs'):
-                    cs_files.append(os.path.join(root, file))
-        return cs_files
+        try:
+            return False, self.is_file_organized(file_path, content), None
+        except Exception as e:
+            return False, False, e
+
+    def check_files(self, file_paths: List[str]) -> Iterator[Tuple]:
+        """Yield check_file's result for each file in order."""
+        batch_io = _UringBatchIO.create() if len(file_paths) > 1 else None
+        if batch_io is None:
+            yield from self.map_threaded(self.check_file, file_paths)
+            return
+
+        # The ring already keeps reads in flight while files are checked, which is all the threads were
+        # for (checking itself holds the GIL), so files are checked in this thread
+        self._batch_io = batch_io
+        wave_size = batch_io.wave_size
+        try:
+            for wave, prefetched in self.read_waves([file_paths[i:i + wave_size]
+                                                     for i in range(0, len(file_paths), wave_size)], organizing=False):
+                self._prefetched = prefetched
+                yield from map(self.check_file, wave)
+        finally:
+            self._prefetched = {}
+            self._digest_state.source = (None, None)  # don't hold on to a batch buffer
+            self.close_batch_io()
 
     def scan_project(self):
         """Scan project and report organization status without modifying files."""
@@ -705,24 +1609,21 @@ class CSharpClassOrganizer:
 
         print(f"📁 Scanning {len(cs_files)} C# files...\n")
 
-        for file_path in cs_files:
-            if self.should_skip_file(file_path):
+        # Files are checked in walk order, either read in waves through the ring or read and checked concurrently
+        for file_path, (skipped, organized, error) in zip(cs_files, self.check_files(cs_files)):
+            if skipped:
                 continue
 
             total_relevant += 1
+            rel_path = self.relative_path(file_path)
 
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                if self.is_already_organized(content):
-                    organized_count += 1
-                    print(f"✅ {os.path.relpath(file_path, self.project_root)}")
-                else:
-                    print(f"❓ {os.path.relpath(file_path, self.project_root)}")
-
-            except Exception as e:
-                print(f"❌ {os.path.relpath(file_path, self.project_root)} - Error: {e}")
+            if error is not None:
+                print(f"❌ {rel_path} - Error: {error}")
+            elif organized:
+                organized_count += 1
+                print(f"✅ {rel_path}")
+            else:
+                print(f"❓ {rel_path}")
 
         print(f"\n📊 Scan Results:")
         print(f"   📁 Total relevant files: {total_relevant}")
@@ -739,7 +1640,8 @@ class CSharpClassOrganizer:
         cs_files = self.find_cs_files()
 
         # Filter out files that should be skipped
-        relevant_files = [f for f in cs_files if not self.should_skip_file(f)]
+        skipped = self.map_threaded(self.should_skip_file, cs_files)
+        relevant_files = self.unique_files([f for f, skip in zip(cs_files, skipped) if not skip])
 
         print(f"📁 Found {len(relevant_files)} relevant C# files in {self.project_root}")
         print(f"🔧 Starting organization process (batch size: {batch_size})...\n")
@@ -747,21 +1649,49 @@ class CSharpClassOrganizer:
         success_count = 0
         processed_count = 0
 
-        for i, file_path in enumerate(relevant_files):
-            # Process in batches
-            if batch_size > 0 and i > 0 and i % batch_size == 0:
-                print(f"\n⏸️  Batch {i // batch_size} completed. Press Enter to continue, or 'q' to quit...")
-                user_input = input().strip().lower()
-                if user_input == 'q':
-                    print("🛑 Organization stopped by user.")
-                    break
-                print()
-
-            processed_count += 1
-            if self.organize_file(file_path):
-                success_count += 1
+        if batch_size > 0:
+            batches = [relevant_files[i:i + batch_size] for i in range(0, len(relevant_files), batch_size)]
+        else:
+            batches = [relevant_files]
+
+        # Files are independent, so they're organized on a process pool (one worker per core)
+        executor = None
+        if self.jobs > 1 and len(relevant_files) > 1:
+            executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_organize_worker,
+                                           initargs=(self.project_root, self.use_regions, self.backup_dir, self.verbose,
+                                                     self.output_cache_dir, bool(self.cache_path)))
+        elif len(relevant_files) > 1 and batch_size != 1:
+            # A ring only pays for itself over several files, so one-file batches keep plain reads and
+            # writes; only this in-process ring is polled, as pool workers already keep every core busy
+            if self.sqpoll:
+                wave_size = _UringBatchIO.tuned_wave_size(self.sample_file_sizes(relevant_files))
+                self._batch_io = _UringBatchIO.create(True, min(wave_size, len(relevant_files)))
+                if self._batch_io is not None:
+                    print(f"⚙️  io_uring depth: {self._batch_io.wave_size} files per wave\n")
             else:
-                print(f"❌ Failed to organize: {os.path.relpath(file_path, self.project_root)}")
+                self._batch_io = _UringBatchIO.create()
+
+        try:
+            for batch_number, batch in enumerate(batches):
+                # Process in batches
+                if batch_number > 0:
+                    print(f"\n⏸️  Batch {batch_number} completed. Press Enter to continue, or 'q' to quit...")
+                    user_input = input().strip().lower()
+                    if user_input == 'q':
+                        print("🛑 Organization stopped by user.")
+                        break
+                    print()
+
+                for file_path, success in zip(batch, self.organize_batch(batch, executor)):
+                    processed_count += 1
+                    if success:
+                        success_count += 1
+                    else:
+                        print(f"❌ Failed to organize: {self.relative_path(file_path)}")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            self.close_batch_io()
 
         print(f"\n✨ Organization complete!")
         print(f"✅ Successfully organized: {success_count}/{processed_count} files")
@@ -769,6 +1699,176 @@ class CSharpClassOrganizer:
         if success_count < processed_count:
             print(f"❌ Failed to organize: {processed_count - success_count} files")
 
+    def unique_files(self, file_paths: List[str]) -> List[str]:
+        """Drop paths to a file already listed (symlinks, hard links), keeping the first."""
+        # A wave reads all its files before writing any, and pool workers run side by side, so a second
+        # path to the same file would be organized from its content from before the first was rewritten
+        seen = set()
+        unique = []
+        for file_path in file_paths:
+            stat_result = self._stat_results.get(file_path)
+            if stat_result is None:
+                try:
+                    stat_result = os.stat(file_path)
+                except OSError:
+                    unique.append(file_path)  # organizing it reports the error
+                    continue
+            file_id = (stat_result.st_dev, stat_result.st_ino)
+            if file_id not in seen:
+                seen.add(file_id)
+                unique.append(file_path)
+        return unique
+
+    def close_batch_io(self):
+        """Release the io_uring ring, if one was set up."""
+        if self._batch_io is not None:
+            self._batch_io.close()
+            self._batch_io = None
+
+    def sample_file_sizes(self, file_paths: List[str], sample_size: int = 32) -> List[int]:
+        """Return the sizes of up to sample_size files spread over the list, reusing the walk's stat results."""
+        sizes = []
+        for file_path in file_paths[::max(1, len(file_paths) // sample_size)][:sample_size]:
+            stat_result = self._stat_results.get(file_path)
+            if stat_result is None:
+                try:
+                    stat_result = os.stat(file_path)
+                except OSError:
+                    continue
+            sizes.append(stat_result.st_size)
+        return sizes
+
+    def organize_batch(self, file_paths: List[str], executor: Optional[ProcessPoolExecutor] = None) -> Iterator[bool]:
+        """Organize files in order, yielding each success flag after its output has been printed."""
+        if executor is None and self._batch_io is None:
+            for file_path in file_paths:
+                yield self.organize_file(file_path)
+            return
+
+        if executor is None:
+            # Batched I/O: each wave of files is read, organized and written back together
+            wave_size = self._batch_io.wave_size
+            waves = [file_paths[i:i + wave_size] for i in range(0, len(file_paths), wave_size)]
+            results = ((self.organize_files(wave, prefetched), (0, 0), {}) for wave, prefetched in self.read_waves(waves))
+        else:
+            chunksize = max(1, min(8, len(file_paths) // (self.jobs * 4)))
+            chunks = [file_paths[i:i + chunksize] for i in range(0, len(file_paths), chunksize)]
+            results = executor.map(_organize_files_worker, chunks)
+
+        for chunk_results, (worker_hits, worker_misses), written_results in results:
+            # Workers count their own output cache lookups and pass on the results for the files they wrote
+            self.output_cache_hits += worker_hits
+            self.output_cache_misses += worker_misses
+            for file_path, cache_results in written_results.items():
+                self.remember_written_file(file_path, cache_results)
+            for success, output in chunk_results:
+                print(output, end='')
+                yield success
+
+    def read_waves(self, waves: List[List[str]], organizing: bool = True) -> Iterator[Tuple[List[str], Dict]]:
+        """Yield each wave of files with the contents read for it through the ring, the next wave's reads in flight meanwhile."""
+        # Checking or organizing a wave doesn't change whether any other file needs reading
+        reads = None
+        for index, wave in enumerate(waves):
+            if reads is None:
+                reads = self.start_reads(wave, organizing)
+            prefetched = dict(zip(reads[0], self._batch_io.finish_reads(reads)))
+            reads = self.start_reads(waves[index + 1], organizing) if index + 1 < len(waves) else None
+            yield wave, prefetched
+
+    def start_reads(self, file_paths: List[str], organizing: bool = True) -> Tuple:
+        """Start reading the files that checking (or organizing) them will read, through the ring."""
+        to_read = [file_path for file_path in file_paths if self.needs_reading(file_path, organizing)]
+        return self._batch_io.start_reads(to_read)
+
+    def organize_files(self, file_paths: List[str], prefetched: Optional[Dict] = None) -> List[Tuple[bool, str]]:
+        """Organize files, returning each success flag with its captured output.
+
+        With batched I/O, every read the files need is done (or prefetched is given) before any file
+        is organized and the rewritten files are written back together afterwards, so a file's output
+        is only final once the whole batch is done.
+        """
+        # A lone file is read and written directly rather than through the ring
+        use_uring = self._batch_io is not None and (prefetched is not None or len(file_paths) > 1)
+        if use_uring:
+            if prefetched is None:
+                to_read = [file_path for file_path in file_paths if self.needs_reading(file_path)]
+                prefetched = dict(zip(to_read, self._batch_io.read_files(to_read)))
+            self._prefetched = prefetched
+            self._pending_writes = {}
+
+        results = []
+        try:
+            for file_path in file_paths:
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    success = self.organize_file(file_path)
+                results.append([success, output.getvalue()])
+            pending_writes = self._pending_writes
+        finally:
+            self._prefetched = {}
+            self._pending_writes = None
+            self._digest_state.source = (None, None)  # don't hold on to a batch buffer that will be reused
+
+        if pending_writes:
+            positions = {file_path: index for index, file_path in enumerate(file_paths)}
+            written = list(pending_writes.items())
+            try:
+                self.flush_backup_archive()
+            except OSError as e:
+                # Without their backups on disk, none of the files are rewritten
+                errors = [e] * len(written)
+            else:
+                errors = self._batch_io.write_files([(file_path, data) for file_path, (data, _, _) in written])
+            for (file_path, (_, report, cache_results)), error in zip(written, errors):
+                result = results[positions[file_path]]
+                if error is None:
+                    self.remember_written_file(file_path, cache_results)
+                    result[1] += report
+                else:
+                    result[0] = False
+                    result[1] += f"❌ Error organizing {file_path}: {str(error)}\n"
+
+        return [tuple(result) for result in results]
+
+
+# Organizer used by each worker process in organize_all_files
+_worker_organizer: Optional[CSharpClassOrganizer] = None
+_worker_ring_requested = False  # whether the worker has tried to set up its io_uring ring
+
+
+def _init_organize_worker(project_root: str, use_regions: bool, backup_dir: str, verbose: bool,
+                          output_cache_dir: Optional[str], collect_written: bool):
+    """Create the organizer for a worker process, sharing the parent's backup directory and output cache
+    (and collecting the cache results of the files it writes, if the parent caches them)."""
+    global _worker_organizer
+    _worker_organizer = CSharpClassOrganizer(project_root, use_regions=use_regions, cache_path=None, jobs=1,
+                                             verbose=verbose, output_cache_dir=output_cache_dir)
+    _worker_organizer.backup_dir = backup_dir
+    # Each worker appends to its own archive; worker processes skip atexit, so close it via a finalizer
+    _worker_organizer.backup_archive_name = f"backups-{os.getpid()}.tar"
+    Finalize(None, _worker_organizer.close_backup_archive, exitpriority=10)
+    Finalize(None, _worker_organizer.close_batch_io, exitpriority=10)
+    if collect_written:
+        _worker_organizer.written_results = {}
+
+
+def _organize_files_worker(file_paths: List[str]) -> Tuple[List[Tuple[bool, str]], Tuple[int, int], Dict]:
+    """Organize a chunk of files in a worker process, returning each success flag and captured output,
+    plus the chunk's output cache (hits, misses) and the cache results of the files it wrote."""
+    global _worker_ring_requested
+    if len(file_paths) > 1 and not _worker_ring_requested:
+        # Only chunks of several files use a ring, so workers only handed single files never pin its buffers
+        _worker_ring_requested = True
+        _worker_organizer._batch_io = _UringBatchIO.create()
+    results = _worker_organizer.organize_files(file_paths)
+    cache_counts = (_worker_organizer.output_cache_hits, _worker_organizer.output_cache_misses)
+    _worker_organizer.output_cache_hits = _worker_organizer.output_cache_misses = 0
+    written_results = _worker_organizer.written_results or {}
+    if written_results:
+        _worker_organizer.written_results = {}
+    return results, cache_counts, written_results
+
 
 def main():
     """Main entry point."""
@@ -787,14 +1887,25 @@ def main():
                        help='Process all files without pausing between batches')
     parser.add_argument('--regions', action='store_true',
                        help='Use #region blocks instead of // comments for organization')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached results and re-check every file')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Number of files to process in parallel (default: number of CPUs, 1 to disable)')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Show the matched declarations when validation fails')
 
     args = parser.parse_args()
 
     project_root = os.path.abspath(args.project_root)
 
-    if not os.path.exists(project_root):
+    try:
+        root_stat = os.stat(project_root)
+    except OSError:
         print(f"❌ Project root directory does not exist: {project_root}")
         sys.exit(1)
+    if not stat.S_ISDIR(root_stat.st_mode):
+        print(f"❌ Project root is not a directory: {project_root}")
+        sys.exit(1)
 
     print("🚀 Godot C# Code Organization Tool")
     print("=" * 40)
@@ -802,13 +1913,18 @@ def main():
     print(f"🎨 Organization Style: {'#region blocks' if args.regions else '// comments'}")
     print()
 
-    organizer = CSharpClassOrganizer(project_root, use_regions=args.regions)
+    organizer = CSharpClassOrganizer(project_root, use_regions=args.regions,
+                                     cache_path=None if args.no_cache else CACHE_PATH, jobs=args.jobs,
+                                     verbose=args.verbose, sqpoll=args.no_pause,
+                                     output_cache_dir=None if args.no_cache else OUTPUT_CACHE_DIR)
 
     if args.scan:
         organizer.scan_project()
     elif args.file:
         file_path = os.path.abspath(args.file)
-        if not os.path.exists(file_path):
+        try:
+            organizer.remember_stat(file_path, os.stat(file_path))
+        except OSError:
             print(f"❌ File does not exist: {file_path}")
             sys.exit(1)
         organizer.organize_file(file_path)
@@ -816,6 +1932,9 @@ def main():
         batch_size = 0 if args.no_pause else args.batch_size
         organizer.organize_all_files(batch_size)
 
+    organizer.report_output_cache()
+    organizer.prune_output_cache()
+
 
 if __name__ == "__main__":
     main()
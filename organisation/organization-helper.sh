@@ -33,7 +33,7 @@ check_python() {
         PYTHON_CMD="python"
     else
         echo "❌ Python not found in PATH"
-        echo "   Please install Python 3.6+ from https://python.org"
+        echo "   Please install Python 3.7+ from https://python.org"
         echo "   Make sure it's available in your system PATH"
         echo "   Then restart your terminal and try again."
         return 1
@@ -42,7 +42,7 @@ check_python() {
     # Verify it's Python 3
     if ! $PYTHON_CMD --version 2>&1 | grep -q "Python 3"; then
         echo "❌ Python 3 is required, but found: $($PYTHON_CMD --version 2>&1)"
-        echo "   Please install Python 3.6+ from https://python.org"
+        echo "   Please install Python 3.7+ from https://python.org"
         return 1
     fi
     
@@ -22,12 +22,12 @@ elif command -v python &> /dev/null; then
         PYTHON_CMD="python"
     else
         echo "❌ Python 3 is required, but found: $PYTHON_VERSION"
-        echo "   Please install Python 3.6+ from https://python.org"
+        echo "   Please install Python 3.7+ from https://python.org"
         exit 1
     fi
 else
     echo "❌ Python not found in PATH"
-    echo "   Please install Python 3.6+ from https://python.org"
+    echo "   Please install Python 3.7+ from https://python.org"
     echo "   Make sure it's available in your system PATH"
     exit 1
 fi